@@ -1,32 +1,64 @@
 import configparser
 import json
-import re
 
-def infer_type(val: str):
+_BOOLS = {
+    'true': True, 'yes': True, 'on': True,
+    'false': False, 'no': False, 'off': False,
+}
+
+def infer_type(val: str) -> bool | int | float | str:
     v = val.strip()
-    lower = v.lower()
-    if lower in ('true', 'yes', 'on'):
-        return True
-    if lower in ('false', 'no', 'off'):
-        return False
-    if re.fullmatch(r'\d+', v):
+    b = _BOOLS.get(v.lower())
+    if b is not None:
+        return b
+    # str.isdecimal matches exactly what r'\d+' did, without the regex engine
+    if v.isdecimal():
         return int(v)
-    if re.fullmatch(r'\d+\.\d*', v):
+    whole, dot, frac = v.partition('.')
+    if dot and whole.isdecimal() and (not frac or frac.isdecimal()):
         return float(v)
     return v
 
-def ini_to_json(input_path: str, output_path: str):
-    cfg = configparser.ConfigParser()
-    cfg.read(input_path)
-
-    data = {}
+def _stream_json(f, cfg, indent):
+    """Write cfg to f as JSON one section at a time, without building a dict of every section first."""
+    sections = cfg.sections()
     # Include DEFAULT as its own section if you like; otherwise just iterate cfg.sections()
-    for section in cfg.sections():
+    if indent is None:
+        # Encode each section as one dict so the C encoder does the per-item work
+        encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+        f.write('{')
+        for i, section in enumerate(sections):
+            values = {key: infer_type(val) for key, val in cfg.items(section)}
+            f.write(f"{',' if i else ''}{encode(section)}:{encode(values)}")
+        f.write('}')
+        return
+
+    # Indented output isn't C-accelerated anyway, so write it item by item
+    encode = json.JSONEncoder().encode
+    pad = ' ' * indent
+    f.write('{')
+    for i, section in enumerate(sections):
+        f.write(f"{',' if i else ''}\n{pad}{encode(section)}: {{")
         items = cfg.items(section)
-        data[section] = {key: infer_type(val) for key, val in items}
+        if items:
+            # Each section goes out in one write
+            f.write(','.join(
+                f"\n{pad * 2}{encode(key)}: {encode(infer_type(val))}" for key, val in items
+            ))
+            f.write(f"\n{pad}}}")
+        else:
+            f.write('}')
+    f.write('\n}' if sections else '}')
+
+def ini_to_json(input_path: str, output_path: str, interpolation: bool = True,
+                indent: int | None = 2):
+    # RawConfigParser skips %(name)s interpolation when it isn't needed
+    cfg = configparser.ConfigParser() if interpolation else configparser.RawConfigParser()
+    cfg.read(input_path)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    # A large buffer amortizes write syscalls across the many small writes
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        _stream_json(f, cfg, indent)
 
 
 
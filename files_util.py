@@ -0,0 +1,185 @@
+import ctypes
+import os
+import stat
+import struct
+import sys
+from functools import wraps
+
+# Extensions the scanners know how to handle, all lowercase
+KNOWN_EXTENSIONS = {
+    '.txt', '.docx', '.pdf', '.py', '.md', '.csv', '.xlsx',
+    '.jpg', '.png', '.gif', '.mp4', '.mp3', '.zip', '.json'
+}
+
+def validate_path(func):
+    """Decorator to validate directory exists before processing."""
+    @wraps(func)
+    def wrapper(directory, extension, *args):
+        # One stat() answers both "exists?" and "is it a directory?"
+        try:
+            st = os.stat(directory)
+        except (OSError, ValueError):
+            # Symlink loops and invalid paths count as missing, as with Path.exists()
+            print(f"❌ Directory {directory} does not exist - skipping")
+            return
+        if not stat.S_ISDIR(st.st_mode):
+            print(f"❌ {directory} is not a directory - skipping")
+            return
+        return func(directory, extension, *args)
+    return wrapper
+
+def validate_extension(func):
+    """Decorator to validate an already-lowercased extension is a known file type."""
+    @wraps(func)
+    def wrapper(directory, extension, *args):
+        if extension not in KNOWN_EXTENSIONS:
+            print(f"⚠️  Unknown extension '{extension}' - skipping")
+            return
+        return func(directory, extension, *args)
+    return wrapper
+
+def print_list(label, items):
+    """Print a list of items with a label."""
+    if items:
+        print(f"{label}:\n {', '.join(items)}")
+    else:
+        print(f"{label}:\n None found")
+
+def _scandir_entries(path):
+    """Yield (name, is_dir, is_file) for each entry in path using os.scandir."""
+    with os.scandir(path) as it:
+        for entry in it:
+            # scandir caches the entry type, so these checks avoid extra stat() calls
+            is_dir = entry.is_dir(follow_symlinks=False)
+            yield entry.name, is_dir, not is_dir and entry.is_file(follow_symlinks=False)
+
+# macOS: getattrlistbulk returns many entries plus their type per syscall
+_getattrlistbulk = None
+if sys.platform == 'darwin':
+    class _AttrList(ctypes.Structure):
+        _fields_ = [
+            ('bitmapcount', ctypes.c_ushort),
+            ('reserved', ctypes.c_uint16),
+            ('commonattr', ctypes.c_uint32),
+            ('volattr', ctypes.c_uint32),
+            ('dirattr', ctypes.c_uint32),
+            ('fileattr', ctypes.c_uint32),
+            ('forkattr', ctypes.c_uint32),
+        ]
+
+    try:
+        _getattrlistbulk = ctypes.CDLL(None, use_errno=True).getattrlistbulk
+        _getattrlistbulk.argtypes = [
+            ctypes.c_int, ctypes.POINTER(_AttrList), ctypes.c_void_p, ctypes.c_size_t, ctypes.c_uint64
+        ]
+        _getattrlistbulk.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _getattrlistbulk = None
+
+_ATTR_BIT_MAP_COUNT = 5
+_ATTR_CMN_NAME = 0x00000001
+_ATTR_CMN_OBJTYPE = 0x00000008
+_ATTR_CMN_RETURNED_ATTRS = 0x80000000
+_FSOPT_PACK_INVAL_ATTRS = 0x00000008
+_VREG, _VDIR = 1, 2
+_BULK_BUFSIZE = 64 * 1024
+
+def _bulk_entries(path):
+    """Yield (name, is_dir, is_file) for each entry in path using getattrlistbulk."""
+    # Only ask for the name and object type, so the kernel fills in nothing else
+    attrs = _AttrList(_ATTR_BIT_MAP_COUNT, 0, _ATTR_CMN_RETURNED_ATTRS | _ATTR_CMN_NAME | _ATTR_CMN_OBJTYPE)
+    buf = ctypes.create_string_buffer(_BULK_BUFSIZE)
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        while True:
+            count = _getattrlistbulk(fd, ctypes.byref(attrs), buf, _BULK_BUFSIZE, _FSOPT_PACK_INVAL_ATTRS)
+            if count < 0:
+                err = ctypes.get_errno()
+                raise OSError(err, os.strerror(err), path)
+            if count == 0:
+                return
+            offset = 0
+            for _ in range(count):
+                # Each record: u32 length, attribute_set_t (5 x u32), name attrreference_t, u32 objtype
+                length, = struct.unpack_from('I', buf, offset)
+                name_offset, name_length, objtype = struct.unpack_from('iII', buf, offset + 24)
+                name_start = offset + 24 + name_offset
+                # name_length includes the trailing NUL
+                name = os.fsdecode(buf[name_start:name_start + name_length - 1])
+                yield name, objtype == _VDIR, objtype == _VREG
+                offset += length
+    finally:
+        os.close(fd)
+
+# Pick the fastest directory listing available on this platform
+iter_dir = _bulk_entries if _getattrlistbulk is not None else _scandir_entries
+
+def _list_dir(path):
+    """Return the entries of path, or an empty list if it can't be read."""
+    try:
+        return list(iter_dir(path))
+    except (PermissionError, OSError):
+        # Gracefully handle permission errors
+        return []
+
+def iter_files(directory, extension, depth=0):
+    """Yield paths of files ending with extension (a str or tuple of str) with depth control.
+
+    depth=0 lists directory only, depth=n descends n levels and depth=-1 never stops.
+    Limited depths follow symlinked directories like the original glob walk;
+    depth=-1 does not, like Path.rglob.
+    """
+    # Walk one level at a time
+    level_dirs = [str(directory)]
+    level = 0
+    # Real paths of symlinked directories already followed, so link cycles are walked once
+    followed = set()
+    while level_dirs:
+        next_dirs = []
+        descend = depth == -1 or level < depth
+        for current_dir in level_dirs:
+            for name, is_dir, is_file in _list_dir(current_dir):
+                if is_dir:
+                    if descend:
+                        next_dirs.append(os.path.join(current_dir, name))
+                elif is_file:
+                    if name.endswith(extension):
+                        yield os.path.join(current_dir, name)
+                else:
+                    # Symlinks are reported as neither, so resolve those here
+                    follow = descend and depth != -1
+                    if not (follow or name.endswith(extension)):
+                        continue
+                    path = os.path.join(current_dir, name)
+                    if os.path.isdir(path):
+                        if follow and _follow_once(path, current_dir, followed):
+                            next_dirs.append(path)
+                    elif name.endswith(extension) and os.path.isfile(path):
+                        yield path
+        level_dirs = next_dirs
+        level += 1
+
+def group_by_extension(directory, extensions, depth=0):
+    """Walk directory once, returning {extension: [file names]} for a tuple of extensions."""
+    # The dict also drops duplicates, e.g. '.pdf' and '.PDF' once lowercased
+    names_by_ext = {extension: [] for extension in extensions}
+    if not names_by_ext:
+        return names_by_ext
+    for path in iter_files(directory, tuple(names_by_ext), depth):
+        name = os.path.basename(path)
+        # Bucket by the extension that matched, not splitext, so '.pdf' or multi-dot extensions aren't lost
+        for extension, names in names_by_ext.items():
+            if name.endswith(extension):
+                names.append(name)
+    return names_by_ext
+
+def _follow_once(link, current_dir, followed):
+    """Return True if the symlinked directory link should be walked into."""
+    target = os.path.normcase(os.path.realpath(link))
+    here = os.path.normcase(os.path.realpath(current_dir))
+    # Skip links back into one of their own ancestors, and targets already walked;
+    # a prefix test with a trailing separator also copes with targets on another drive
+    if target in followed or (here + os.sep).startswith(target.rstrip(os.sep) + os.sep):
+        return False
+    followed.add(target)
+    return True
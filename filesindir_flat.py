@@ -1,55 +1,15 @@
+import os
 import pathlib
-import itertools
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
 
-def validate_path(func):
-    """Decorator to validate directory exists before processing."""
-    @wraps(func)
-    def wrapper(directory, extension):
-        if not directory.exists():
-            print(f"❌ Directory {directory} does not exist - skipping")
-            return
-        if not directory.is_dir():
-            print(f"❌ {directory} is not a directory - skipping")
-            return
-        return func(directory, extension)
-    return wrapper
-
-
-def validate_extension(func):
-    """Decorator to validate extension is a known file type."""
-    KNOWN_EXTENSIONS = {
-        '.txt', '.docx', '.pdf', '.py', '.md', '.csv', '.xlsx',
-        '.jpg', '.png', '.gif', '.mp4', '.mp3', '.zip', '.json'
-    }
-
-    @wraps(func)
-    def wrapper(directory, extension):
-        if extension.lower() not in KNOWN_EXTENSIONS:
-            print(f"⚠️  Unknown extension '{extension}' - skipping")
-            return
-        return func(directory, extension)
-    return wrapper
-
-
-def print_list(label, items):
-    """Print a list of items with a label."""
-    if items:
-        print(f"{label}:\n {', '.join(items)}")
-    else:
-        print(f"{label}:\n None found")
-
-def get_files_by_extension(directory, extension):
-    """Get files with specified extension from directory."""
-    return list(directory.glob(f"*{extension}"))
+from files_util import KNOWN_EXTENSIONS, validate_path, validate_extension, print_list, group_by_extension
 
 @validate_path
 @validate_extension
-def process_and_print_files(directory, extension):
+def process_and_print_files(directory, extension, names_by_ext):
     """Process files in directory and print both names and stems."""
-    files = get_files_by_extension(directory, extension)
-    files_with_ext = [f.name for f in files]
-    file_stems = [f.stem for f in files]
+    files_with_ext = names_by_ext.get(extension, [])
+    file_stems = [os.path.splitext(name)[0] for name in files_with_ext]
     
     print(f"\nFiles in {directory} with extension {extension}:")
     print_list("files with extensions", files_with_ext)
@@ -57,8 +17,16 @@ def process_and_print_files(directory, extension):
 
 def scan_directories(directories, extensions):
     """Scan all combinations of directories and extensions."""
-    for directory, extension in itertools.product(directories, extensions):
-        process_and_print_files(directory, extension)
+    # Normalize each extension once rather than once per directory
+    extensions = [extension.lower() for extension in extensions]
+    # Only known extensions are worth matching; the rest are reported and skipped when printing
+    known = tuple(extension for extension in extensions if extension in KNOWN_EXTENSIONS)
+    # List each directory once, all of them concurrently, and reuse it for every extension
+    with ThreadPoolExecutor() as executor:
+        listings = list(executor.map(lambda directory: group_by_extension(directory, known), directories))
+    for directory, names_by_ext in zip(directories, listings):
+        for extension in extensions:
+            process_and_print_files(directory, extension, names_by_ext)
 
 # Define directories and extensions separately
 directories = [
@@ -1,78 +1,15 @@
+import os
 import pathlib
-import itertools
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
 
-def validate_path(func):
-    """Decorator to validate directory exists before processing."""
-    @wraps(func)
-    def wrapper(directory, extension, depth=0):
-        if not directory.exists():
-            print(f"❌ Directory {directory} does not exist - skipping")
-            return
-        if not directory.is_dir():
-            print(f"❌ {directory} is not a directory - skipping")
-            return
-        return func(directory, extension, depth)
-    return wrapper
-
-def validate_extension(func):
-    """Decorator to validate extension is a known file type."""
-    KNOWN_EXTENSIONS = {
-        '.txt', '.docx', '.pdf', '.py', '.md', '.csv', '.xlsx',
-        '.jpg', '.png', '.gif', '.mp4', '.mp3', '.zip', '.json'
-    }
-
-    @wraps(func)
-    def wrapper(directory, extension, depth=0):
-        if extension.lower() not in KNOWN_EXTENSIONS:
-            print(f"⚠️  Unknown extension '{extension}' - skipping")
-            return
-        return func(directory, extension, depth)
-    return wrapper
-
-def print_list(label, items):
-    """Print a list of items with a label."""
-    if items:
-        print(f"{label}:\n {', '.join(items)}")
-    else:
-        print(f"{label}:\n None found")
-
-def get_files_by_extension(directory, extension, depth=0):
-    """Get files with specified extension from directory with depth control."""
-    if depth == 0:
-        # Current directory only
-        return list(directory.glob(f"*{extension}"))
-    elif depth == -1:
-        # Unlimited recursion
-        return list(directory.rglob(f"*{extension}"))
-    else:
-        # Limited depth recursion
-        files = []
-        
-        def collect_files(current_dir, current_depth, max_depth):
-            try:
-                # Get files in current directory
-                files.extend(current_dir.glob(f"*{extension}"))
-                
-                # If we haven't reached max depth, recurse into subdirectories
-                if current_depth < max_depth:
-                    for subdir in current_dir.iterdir():
-                        if subdir.is_dir():
-                            collect_files(subdir, current_depth + 1, max_depth)
-            except (PermissionError, OSError):
-                # Gracefully handle permission errors
-                pass
-        
-        collect_files(directory, 0, depth)
-        return files
+from files_util import KNOWN_EXTENSIONS, validate_path, validate_extension, print_list, group_by_extension
 
 @validate_path
 @validate_extension
-def process_and_print_files(directory, extension, depth=0):
-    """Process files in directory and print both names and stems."""
-    files = get_files_by_extension(directory, extension, depth)
-    files_with_ext = [f.name for f in files]
-    file_stems = [f.stem for f in files]
+def process_and_print_files(directory, extension, depth, found):
+    """Print names and stems of the files found in directory."""
+    files_with_ext = found[extension]
+    file_stems = [os.path.splitext(name)[0] for name in files_with_ext]
     
     depth_desc = {
         0: "current directory only",
@@ -86,8 +23,16 @@ def process_and_print_files(directory, extension, depth=0):
 
 def scan_directories(dir_depth_pairs, extensions):
     """Scan all combinations of directories/depths and extensions."""
-    for (directory, depth), extension in itertools.product(dir_depth_pairs, extensions):
-        process_and_print_files(directory, extension, depth)
+    # Normalize each extension once rather than once per directory
+    extensions = [extension.lower() for extension in extensions]
+    # Only known extensions are worth matching; the rest are reported and skipped when printing
+    known = tuple(extension for extension in extensions if extension in KNOWN_EXTENSIONS)
+    # Walk the directories concurrently, then print in order so output doesn't interleave
+    with ThreadPoolExecutor() as executor:
+        found = list(executor.map(lambda pair: group_by_extension(pair[0], known, pair[1]), dir_depth_pairs))
+    for (directory, depth), found_in_dir in zip(dir_depth_pairs, found):
+        for extension in extensions:
+            process_and_print_files(directory, extension, depth, found_in_dir)
 
 # Define directories with individual depth settings
 directories = [
@@ -1,3 +1,4 @@
+import os
 import pathlib
 
 # helper function to keep the ugly join out of the main code
@@ -7,16 +8,28 @@ def print_list(label, items):
     else:
         print(f"{label}:\n None found")
 
+# is_file() can raise (e.g. on a symlink loop); treat such entries as not files
+def is_file(entry):
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
 # path to directory of interest
 dir_of_interest = pathlib.Path.home() / "Documents"
 
 # extension of interest
 ext_of_interest = ".pdf"
 
-# file names with extensions
-files_with_ext = [f.name for f in dir_of_interest.glob(f"*{ext_of_interest}")]
+# file names with extensions (one directory listing, plain suffix check, files only)
+try:
+    with os.scandir(dir_of_interest) as entries:
+        files_with_ext = [e.name for e in entries if e.name.endswith(ext_of_interest) and is_file(e)]
+except OSError:
+    # a missing or unreadable directory just means nothing was found
+    files_with_ext = []
 # file names without extensions
-file_stems = [f.stem for f in dir_of_interest.glob(f"*{ext_of_interest}")]
+file_stems = [os.path.splitext(name)[0] for name in files_with_ext]
 
 # print the results
 print(f"Files in {dir_of_interest} with extension {ext_of_interest}:")